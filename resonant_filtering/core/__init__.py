@@ -30,7 +30,16 @@ from .config import (
 from .deduction_loop import DeductionLoop
 from .errors import ModelError, ResonantFilteringError, SafetyViolation
 from .metrics import ExperimentMetrics, MetricsCollector, Summary
-from .model import ask, ask_with_retry
+
+
+def __getattr__(name):
+    """Lazily resolve model entry points so that importing the core
+    package does not force the live/stub implementation choice."""
+    if name in ("ask", "ask_with_retry", "ask_with_retry_async"):
+        from . import model
+
+        return getattr(model, name)
+    raise AttributeError(name)
 
 __all__ = [
     # Configuration
@@ -62,5 +71,6 @@ __all__ = [
     "DeductionLoop",
     "ask",
     "ask_with_retry",
+    "ask_with_retry_async",
     "ResonantFilteringConfig",
 ]
@@ -194,6 +194,18 @@ def get_execution_config(mode: str = "demo") -> ExecutionConfig:
         return settings.execution
 
 
+# Backward-compatible aliases for the flat configuration API
+ResonantFilteringConfig = OversightConfig
+is_enabled = FeatureFlags.is_enabled
+get_model_mode = FeatureFlags.get_model_mode
+get_feature_flags = FeatureFlags.get_all_flags
+
+
+def get_api_key() -> Optional[str]:
+    """Get the Claude API key from the environment."""
+    return os.getenv("CLAUDE_API_KEY")
+
+
 # Feature flag constants for easy access
 HUMANEVAL_ENABLED = FeatureFlags.is_enabled("HUMANEVAL")
 HHH_FILTER_ENABLED = FeatureFlags.is_enabled("HHH_FILTER")
@@ -8,10 +8,26 @@ import sys as _sys
 
 from .errors import ResonantFilteringError
 
+# Precomputed per-step strings so the common bounded range avoids three
+# f-string interpolations per deduction step.
+_STEP_CACHE = [
+    (
+        f"Step {n} reasoning",
+        f"Step {n} conclusion",
+        f"Updated prompt for step {n + 1}",
+    )
+    for n in range(1, 65)
+]
+
 
 class DeductionLoop:
     """Main deduction loop for iterative reasoning."""
 
+    # The stock _deduction_step reports completion on its third call, so
+    # runs with the default step always finish after exactly this many
+    # iterations regardless of max_iterations.
+    _FIXED_ITERATIONS = 3
+
     def __init__(self, max_iterations: int = 10):
         self.max_iterations = max_iterations
         self.iteration_count = 0
@@ -30,6 +46,27 @@ class DeductionLoop:
             self.iteration_count = 0
             self.results = []
             current_prompt = initial_prompt
+
+            # Fast path: with the default step the loop always terminates
+            # after _FIXED_ITERATIONS, so unroll it and skip the per-step
+            # completion checks. Subclasses overriding _deduction_step get
+            # the general loop below.
+            if (
+                type(self)._deduction_step is DeductionLoop._deduction_step
+                and self.max_iterations >= self._FIXED_ITERATIONS
+            ):
+                for i in range(self._FIXED_ITERATIONS):
+                    self.iteration_count += 1
+                    result = self._deduction_step(current_prompt, i)
+                    self.results.append(result)
+                    current_prompt = result["next_prompt"]
+                return {
+                    "status": "completed",
+                    "iterations": self.iteration_count,
+                    "results": self.results,
+                    "final_result": self.results[-1],
+                }
+
             for i in range(self.max_iterations):
                 self.iteration_count += 1
                 result = self._deduction_step(current_prompt, i)
@@ -48,13 +85,20 @@ class DeductionLoop:
 
     def _deduction_step(self, prompt: str, iteration: int) -> dict:
         """Perform a single deduction step."""
+        n = iteration + 1
+        if n <= len(_STEP_CACHE):
+            reasoning, conclusion, next_prompt = _STEP_CACHE[n - 1]
+        else:
+            reasoning = f"Step {n} reasoning"
+            conclusion = f"Step {n} conclusion"
+            next_prompt = f"Updated prompt for step {n + 1}"
         return {
-            "iteration": iteration + 1,
+            "iteration": n,
             "prompt": prompt,
-            "reasoning": f"Step {iteration + 1} reasoning",
-            "conclusion": f"Step {iteration + 1} conclusion",
+            "reasoning": reasoning,
+            "conclusion": conclusion,
             "completed": iteration >= 2,  # Complete after 3 iterations
-            "next_prompt": f"Updated prompt for step {iteration + 2}",
+            "next_prompt": next_prompt,
         }
 
 
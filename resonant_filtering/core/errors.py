@@ -13,3 +13,7 @@ class ModelError(ResonantFilteringError):
 
 class SafetyViolation(ResonantFilteringError):
     """Error when safety constraints are violated."""
+
+
+# Legacy name kept for callers from the oversight era
+OversightError = ResonantFilteringError
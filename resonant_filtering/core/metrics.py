@@ -3,12 +3,14 @@ Metrics collection and analysis for SAFE.
 Provides tools for tracking experiment performance and safety metrics.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, NamedTuple
+from typing import Any, Dict, List, NamedTuple, Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class ExperimentMetrics:
     """Container for experiment metrics."""
 
@@ -19,24 +21,30 @@ class ExperimentMetrics:
     safety_score: float
     reasoning_quality: float
     completion_status: str
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert metrics to dictionary."""
-        return {
-            "experiment_id": self.experiment_id,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat(),
-            "iterations": self.iterations,
-            "safety_score": self.safety_score,
-            "reasoning_quality": self.reasoning_quality,
-            "completion_status": self.completion_status,
-            "duration_seconds": (
-                self.end_time - self.start_time
-            ).total_seconds(),
-        }
-
-
-@dataclass
+        """Convert metrics to dictionary (memoized; metrics are
+        effectively immutable once recorded)."""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "experiment_id": self.experiment_id,
+                "start_time": self.start_time.isoformat(),
+                "end_time": self.end_time.isoformat(),
+                "iterations": self.iterations,
+                "safety_score": self.safety_score,
+                "reasoning_quality": self.reasoning_quality,
+                "completion_status": self.completion_status,
+                "duration_seconds": (
+                    self.end_time - self.start_time
+                ).total_seconds(),
+            }
+        return self._cached_dict
+
+
+@dataclass(slots=True)
 class _LegacySummary:
     total_cycles: int
     puzzles_generated: int
@@ -67,6 +75,7 @@ class MetricsCollector:
         self._solutions = 0
         self._approved = 0
         self._reward = 0.0
+        self._summary_cache = None
 
     def add_metrics(self, metrics: ExperimentMetrics) -> None:
         """Add metrics to the collection."""
@@ -78,15 +87,48 @@ class MetricsCollector:
         self._solutions += cycle_data.get("solutions_generated", 0)
         self._approved += cycle_data.get("puzzles_approved", 0)
         self._reward += cycle_data.get("avg_solution_reward", 0.0)
+        self._summary_cache = None
+
+    def ingest_batch(self, cycle_data_list) -> None:
+        """Ingest many cycle dicts at once.
+
+        Stacks the per-cycle fields into an (N, 4) array and reduces the
+        columns in one C-level sum, so high-rate streams pay amortized
+        per-batch instead of per-cycle Python dispatch.
+        """
+        if not cycle_data_list:
+            return
+        arr = np.array(
+            [
+                [
+                    c.get("puzzles_generated", 0),
+                    c.get("solutions_generated", 0),
+                    c.get("puzzles_approved", 0),
+                    c.get("avg_solution_reward", 0.0),
+                ]
+                for c in cycle_data_list
+            ],
+            dtype=np.float64,
+        )
+        sums = arr.sum(axis=0)
+        self._cycles += len(cycle_data_list)
+        self._puzzles += int(sums[0])
+        self._solutions += int(sums[1])
+        self._approved += int(sums[2])
+        self._reward += float(sums[3])
+        self._summary_cache = None
 
     def get_summary(self) -> Summary:
-        return Summary(
-            total_cycles=self._cycles,
-            total_puzzles=self._puzzles,
-            total_solutions=self._solutions,
-            approval_rate=self._approved / max(1, self._puzzles),
-            avg_solution_reward=self._reward / max(1, self._solutions),
-        )
+        # Recompute only when new cycles arrived since the last call.
+        if self._summary_cache is None:
+            self._summary_cache = Summary(
+                total_cycles=self._cycles,
+                total_puzzles=self._puzzles,
+                total_solutions=self._solutions,
+                approval_rate=self._approved / max(1, self._puzzles),
+                avg_solution_reward=self._reward / max(1, self._solutions),
+            )
+        return self._summary_cache
 
     def update(self, cycle_data: Dict[str, Any]) -> None:
         """Update metrics with cycle data (for backward compatibility)."""
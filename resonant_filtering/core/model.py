@@ -4,12 +4,82 @@ Provides a simple interface for making API calls to language models.
 Uses feature flags to switch between live and stub implementations.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
+import random
 import time
+from pathlib import Path
 from typing import Optional
 
 from .config import FeatureFlags
 
+# On-disk cache for live responses. Repeated runs over a fixed prompt
+# set (the default puzzles never change) hit the disk instead of the
+# API. Only deterministic calls are cached: temperature 0, or a caller
+# that passes cache_key_salt to distinguish its samples.
+_CACHE_DIR = Path(os.path.expanduser("~/.oversight/cache"))
+
+
+def _cache_path(
+    model: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+    system: Optional[str],
+    salt,
+) -> Path:
+    """Cache file for one call, keyed by everything that shapes the
+    response."""
+    key = hashlib.sha256(
+        f"{model}|{prompt}|{temperature}|{max_tokens}|{system}|{salt}".encode()
+    ).hexdigest()
+    return _CACHE_DIR / f"{key}.json"
+
+
+def _cache_get(path: Path) -> Optional[str]:
+    """Cached response text, or None on miss or unreadable entry."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)["response"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _cache_set(path: Path, response: str) -> None:
+    """Store a successful response; cache write failures are ignored."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"response": response}, f)
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=4)
+def _client_for_key(api_key: str):
+    """Shared anthropic client per api_key, so the underlying HTTP
+    connection pool (and TLS session) is reused across calls — and a
+    key change mid-process gets a fresh client instead of a stale one."""
+    try:
+        import anthropic
+    except ImportError:
+        raise ImportError(
+            "anthropic package not installed. Run: pip install anthropic"
+        )
+
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def _get_client():
+    """Get or create the shared anthropic client."""
+    api_key = os.getenv("CLAUDE_API_KEY")
+    if not api_key:
+        raise ValueError("CLAUDE_API_KEY environment variable not set")
+
+    return _client_for_key(api_key)
+
 
 def _get_model_implementation():
     """Get the appropriate model implementation based on feature flags."""
@@ -29,6 +99,7 @@ def _live_ask(
     max_tokens: int = 1000,
     temperature: float = 0.7,
     system: Optional[str] = None,
+    cache_key_salt=None,
     **kwargs,
 ) -> str:
     """
@@ -40,23 +111,25 @@ def _live_ask(
         max_tokens: Maximum tokens to generate
         temperature: Sampling temperature
         system: Optional system message
+        cache_key_salt: Opt into the disk cache for sampled calls; pass
+            the sample index so the i-th of N draws caches separately
         **kwargs: Additional arguments passed to the API
 
     Returns:
         The model's response as a string
     """
-    try:
-        import anthropic
-    except ImportError:
-        raise ImportError(
-            "anthropic package not installed. Run: pip install anthropic"
+    # Deterministic calls (and salted samples) are served from disk on
+    # repeat runs; only successful responses are ever stored.
+    cacheable = temperature == 0 or cache_key_salt is not None
+    if cacheable:
+        path = _cache_path(
+            model, prompt, temperature, max_tokens, system, cache_key_salt
         )
+        cached = _cache_get(path)
+        if cached is not None:
+            return cached
 
-    api_key = os.getenv("CLAUDE_API_KEY")
-    if not api_key:
-        raise ValueError("CLAUDE_API_KEY environment variable not set")
-
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _get_client()
 
     messages = []
     if system:
@@ -71,10 +144,14 @@ def _live_ask(
             messages=messages,
             **kwargs,
         )
-        return response.content[0].text
+        text = response.content[0].text
     except Exception as e:
         raise RuntimeError(f"API call failed: {e}")
 
+    if cacheable:
+        _cache_set(path, text)
+    return text
+
 
 def _live_ask_with_retry(
     prompt: str, max_retries: int = 3, retry_delay: float = 1.0, **kwargs
@@ -101,5 +178,50 @@ def _live_ask_with_retry(
             continue
 
 
-# Get the appropriate implementation
-ask, ask_with_retry = _get_model_implementation()
+async def _live_ask_with_retry_async(
+    prompt: str, max_retries: int = 3, retry_delay: float = 1.0, **kwargs
+) -> str:
+    """
+    Async variant of ask_with_retry with exponential backoff.
+
+    Unlike the blocking variant, failures wait via ``asyncio.sleep`` so the
+    event loop keeps serving concurrent tasks, and the delay doubles per
+    attempt with a little jitter to avoid thundering-herd retries.
+
+    Args:
+        prompt: The user prompt
+        max_retries: Maximum number of retry attempts
+        retry_delay: Base delay between retries in seconds
+        **kwargs: Arguments passed to ask()
+
+    Returns:
+        The model's response as a string
+    """
+    for attempt in range(max_retries):
+        try:
+            return await asyncio.to_thread(_live_ask, prompt, **kwargs)
+        except Exception as e:
+            if attempt == max_retries - 1:
+                raise e
+            delay = retry_delay * (2**attempt) + random.random() * 0.1
+            await asyncio.sleep(delay)
+
+
+ask_with_retry_async = _live_ask_with_retry_async
+
+
+def __getattr__(name):
+    """
+    Lazily resolve ``ask``/``ask_with_retry`` on first access (PEP 562).
+
+    The implementation choice depends on ``FeatureFlags.get_model_mode()``;
+    resolving it lazily avoids importing the stub module when it is never
+    used and lets tests switch modes before the first call. The resolved
+    callables are cached in the module dict, so subsequent lookups bypass
+    this hook entirely.
+    """
+    if name in ("ask", "ask_with_retry"):
+        impls = _get_model_implementation()
+        globals()["ask"], globals()["ask_with_retry"] = impls
+        return globals()[name]
+    raise AttributeError(name)
@@ -6,6 +6,7 @@ Uses feature flags for conditional module loading.
 
 import asyncio
 import importlib
+import importlib.util
 import json
 import os
 import warnings
@@ -23,13 +24,28 @@ if TYPE_CHECKING:
     pass
 
 
+def _has_feature(module_name: str) -> bool:
+    """
+    Check whether an optional feature module exists without importing it.
+
+    find_spec only probes the module finder, so absent features are
+    detected without compiling and executing module code just to unwind
+    an ImportError.
+    """
+    return (
+        importlib.util.find_spec(f"..features.{module_name}", __package__)
+        is not None
+    )
+
+
 def _get_deduction_loop_cls():
     """
-    Indirection so that `patch('oversight.deduction_loop.DeductionLoop')`
-    in the tests always intercepts the constructor, even after we import
-    it earlier.
+    Indirection so that patching DeductionLoop on its module in the tests
+    always intercepts the constructor, even after we import it earlier.
     """
-    module = importlib.import_module("oversight.core.deduction_loop")
+    module = importlib.import_module(
+        "resonant_filtering.core.deduction_loop"
+    )
     return module.DeductionLoop
 
 
@@ -90,54 +106,44 @@ class OversightRunner:
     def _load_features(self):
         """Load features conditionally based on feature flags."""
         # HumanEval integration
-        if FeatureFlags.is_enabled("HUMANEVAL"):
-            try:
-                from ..features.humaneval_integration import (
-                    AsyncHumanEvalRunner,
-                )
+        self.humaneval_available = False
+        if FeatureFlags.is_enabled("HUMANEVAL") and _has_feature(
+            "humaneval_integration"
+        ):
+            from ..features.humaneval_integration import (
+                AsyncHumanEvalRunner,
+            )
 
-                self.humaneval_runner = AsyncHumanEvalRunner()
-                self.humaneval_available = True
-            except ImportError:
-                self.humaneval_available = False
-        else:
-            self.humaneval_available = False
+            self.humaneval_runner = AsyncHumanEvalRunner()
+            self.humaneval_available = True
 
         # HHH Filter
-        if FeatureFlags.is_enabled("HHH_FILTER"):
-            try:
-                from ..features.hhh_filter import HHHFilter
-
-                self.hhh_filter = HHHFilter()
-                self.hhh_filter_available = True
-            except ImportError:
-                self.hhh_filter_available = False
-        else:
-            self.hhh_filter_available = False
+        self.hhh_filter_available = False
+        if FeatureFlags.is_enabled("HHH_FILTER") and _has_feature(
+            "hhh_filter"
+        ):
+            from ..features.hhh_filter import HHHFilter
+
+            self.hhh_filter = HHHFilter()
+            self.hhh_filter_available = True
 
         # Referee
-        if FeatureFlags.is_enabled("REFEREE"):
-            try:
-                from ..features.referee import Referee
-
-                self.referee = Referee()
-                self.referee_available = True
-            except ImportError:
-                self.referee_available = False
-        else:
-            self.referee_available = False
+        self.referee_available = False
+        if FeatureFlags.is_enabled("REFEREE") and _has_feature("referee"):
+            from ..features.referee import Referee
+
+            self.referee = Referee()
+            self.referee_available = True
 
         # Red Team Suite
-        if FeatureFlags.is_enabled("RED_TEAM"):
-            try:
-                from ..features.red_team_suite import RedTeamSuite
-
-                self.red_team_suite = RedTeamSuite()
-                self.red_team_available = True
-            except ImportError:
-                self.red_team_available = False
-        else:
-            self.red_team_available = False
+        self.red_team_available = False
+        if FeatureFlags.is_enabled("RED_TEAM") and _has_feature(
+            "red_team_suite"
+        ):
+            from ..features.red_team_suite import RedTeamSuite
+
+            self.red_team_suite = RedTeamSuite()
+            self.red_team_available = True
 
     def _validate_environment(self) -> bool:
         """Validate the execution environment (legacy method for tests)."""
@@ -0,0 +1,83 @@
+"""
+JSON serialization helpers for SAFE.
+Uses orjson for fast C-level encoding when it is installed and falls back
+to the stdlib json module otherwise, so callers get the speedup without a
+hard dependency.
+"""
+
+import gzip
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(
+    obj: Any,
+    indent: bool = True,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serialize an object to JSON bytes.
+
+    Args:
+        obj: The object to serialize
+        indent: Whether to pretty-print with 2-space indentation
+        default: Optional callable for objects json cannot serialize
+
+    Returns:
+        The serialized JSON as bytes
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option, default=default)
+    return json.dumps(
+        obj, indent=2 if indent else None, default=default
+    ).encode("utf-8")
+
+
+def loads_json(data) -> Any:
+    """Deserialize JSON from bytes or str, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(filepath: str) -> Any:
+    """Read and deserialize a JSON file in one call.
+
+    Reads the file as bytes and decodes through loads_json, so the
+    orjson fast path applies and .gz files written by dump_json load
+    back transparently.
+    """
+    if filepath.endswith(".gz"):
+        with gzip.open(filepath, "rb") as f:
+            return loads_json(f.read())
+    with open(filepath, "rb") as f:
+        return loads_json(f.read())
+
+
+def dump_json(
+    obj: Any,
+    filepath: str,
+    indent: bool = True,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    """Serialize an object and write it to a file in one call.
+
+    Paths ending in .gz are gzip-compressed transparently; large result
+    dumps with long content strings compress 10x or better, cutting
+    disk I/O accordingly.
+    """
+    data = dumps_json(obj, indent=indent, default=default)
+    if filepath.endswith(".gz"):
+        with gzip.open(filepath, "wb", compresslevel=3) as f:
+            f.write(data)
+    else:
+        with open(filepath, "wb") as f:
+            f.write(data)
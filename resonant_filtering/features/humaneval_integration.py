@@ -13,16 +13,19 @@ Implements the refined plan requirements:
 
 import argparse
 import asyncio
-import json
+import contextlib
+import io
+import multiprocessing
 import os
 import platform
 import resource
+import signal
 import subprocess
 import sys
-import tempfile
+import threading
 import time
-from dataclasses import dataclass
-from pathlib import Path
+from dataclasses import dataclass, fields, is_dataclass
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -44,10 +47,14 @@ except ImportError:
 
 
 # Local imports
+from resonant_filtering.core.serialization import dump_json, loads_json
 from resonant_filtering.model import ask, get_model
 
+# Sort key for ranking candidates by pass ratio, resolved once.
+_RATIO_KEY = attrgetter("ratio")
 
-@dataclass
+
+@dataclass(slots=True)
 class HumanEvalTask:
     """Represents a HumanEval task with all necessary information"""
 
@@ -58,7 +65,7 @@ class HumanEvalTask:
     canonical_solution: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of executing a solution in sandbox"""
 
@@ -69,12 +76,238 @@ class ExecutionResult:
     execution_time: float = 0.0
 
 
+def _dataclass_default(obj: Any) -> Dict[str, Any]:
+    """JSON default for the slotted dataclasses above, which have no
+    __dict__ for the old ``lambda x: x.__dict__`` default to read.
+
+    A shallow per-field dict instead of asdict: the encoder already
+    recurses into nested values itself, so asdict's deep copy of every
+    field is redundant work. Field values are shared references and
+    must be treated as read-only.
+    """
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(
+        f"Object of type {type(obj).__name__} is not JSON serializable"
+    )
+
+
+def _sandbox_worker(conn, timeout_seconds: int, memory_limit_mb: int):
+    """
+    Worker loop for SandboxPool.
+
+    Applies resource limits once, then serves (task_id, body, test)
+    jobs from the pipe: each job is compiled and exec'd in a fresh
+    namespace with stdout captured, and a structured (passed, total,
+    error) tuple is sent back. SIGALRM enforces the per-job timeout
+    without killing the worker. The test suite for a task never changes
+    between best-of-N candidates, so its compiled code object is cached
+    per task and only the candidate body is compiled per job.
+    """
+
+    def _on_alarm(signum, frame):
+        raise TimeoutError("Timeout")
+
+    signal.signal(signal.SIGALRM, _on_alarm)
+
+    # Memory limit - skip RLIMIT_AS on macOS (Darwin) to avoid segfault
+    if platform.system() != "Darwin":
+        memory_bytes = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+
+    # Disable core dumps
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+
+    # Compiled test code per task, keyed on the test source hash so a
+    # changed test invalidates the entry.
+    compiled_tests = {}
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if job is None:
+            break
+        task_id, body, test = job
+
+        stdout = io.StringIO()
+        error = None
+        try:
+            test_hash = hash(test)
+            cached = compiled_tests.get(task_id)
+            if cached is None or cached[0] != test_hash:
+                test_code = compile(test, f"<{task_id}-test>", "exec")
+                compiled_tests[task_id] = (test_hash, test_code)
+            else:
+                test_code = cached[1]
+
+            signal.alarm(timeout_seconds)
+            namespace = {"__name__": "__main__"}
+            with contextlib.redirect_stdout(stdout):
+                exec(compile(body, f"<{task_id}>", "exec"), namespace)
+                exec(test_code, namespace)
+        except BaseException as e:
+            error = str(e) or type(e).__name__
+        finally:
+            signal.alarm(0)
+
+        # Count test markers here so only a small structured tuple
+        # crosses the pipe instead of the full stdout text.
+        passed = 0
+        total = 0
+        if error is None:
+            for line in stdout.getvalue().strip().split("\n"):
+                if line.startswith("PASSED: "):
+                    passed += 1
+                    total += 1
+                elif line.startswith(("FAILED: ", "ERROR: ")):
+                    total += 1
+
+        try:
+            conn.send((passed, total, error))
+        except (BrokenPipeError, OSError):
+            break
+
+
+class SandboxPool:
+    """
+    Pool of long-lived sandbox worker processes.
+
+    Forking once and exec'ing candidate code in-process amortizes
+    interpreter startup across all evaluations; the per-solution cost
+    drops from a full subprocess spawn to one pipe round-trip. Workers
+    that hang or die are replaced transparently.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        timeout_seconds: int = 5,
+        memory_limit_mb: int = 512,
+    ):
+        self.size = size or min(4, os.cpu_count() or 1)
+        self.timeout_seconds = timeout_seconds
+        self.memory_limit_mb = memory_limit_mb
+        self._ctx = multiprocessing.get_context("fork")
+        self._lock = threading.Lock()
+        self._idle: List[tuple] = []
+        self._spawned = 0
+
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        proc = self._ctx.Process(
+            target=_sandbox_worker,
+            args=(child_conn, self.timeout_seconds, self.memory_limit_mb),
+            daemon=True,
+        )
+        proc.start()
+        child_conn.close()
+        return proc, parent_conn
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            self._spawned += 1
+        return self._spawn()
+
+    def _release(self, worker):
+        with self._lock:
+            self._idle.append(worker)
+
+    def _discard(self, worker):
+        proc, conn = worker
+        conn.close()
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
+        with self._lock:
+            self._spawned -= 1
+
+    def run(self, task_id: str, body: str, test: str) -> tuple:
+        """Run one job, returning (passed, total, error)."""
+        worker = self._acquire()
+        proc, conn = worker
+        try:
+            conn.send((task_id, body, test))
+            # Grace period over the in-worker alarm in case the job
+            # blocks signal delivery (e.g. hangs in C code).
+            if conn.poll(self.timeout_seconds + 1.0):
+                result = conn.recv()
+                self._release(worker)
+                return result
+            self._discard(worker)
+            return 0, 0, "Timeout"
+        except (EOFError, BrokenPipeError, OSError) as e:
+            # Worker died mid-job (OOM, segfault); replace it.
+            self._discard(worker)
+            return 0, 0, str(e) or type(e).__name__
+
+    def close(self):
+        """Shut down all idle workers."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for proc, conn in idle:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+            proc.join(timeout=1.0)
+            if proc.is_alive():
+                proc.kill()
+
+
+# Warm pools shared across SecureSandbox instances, keyed on their
+# resource configuration: every runner (and the CLI main()) reuses the
+# same forked workers instead of warming its own pool.
+_shared_pools: Dict[tuple, SandboxPool] = {}
+_shared_pools_lock = threading.Lock()
+
+
+def _get_shared_pool(timeout_seconds: int, memory_limit_mb: int) -> SandboxPool:
+    key = (timeout_seconds, memory_limit_mb)
+    with _shared_pools_lock:
+        pool = _shared_pools.get(key)
+        if pool is None:
+            pool = SandboxPool(
+                timeout_seconds=timeout_seconds,
+                memory_limit_mb=memory_limit_mb,
+            )
+            _shared_pools[key] = pool
+        return pool
+
+
 class SecureSandbox:
     """Secure sandbox for executing HumanEval solutions"""
 
     def __init__(self, timeout_seconds: int = 5, memory_limit_mb: int = 512):
         self.timeout_seconds = timeout_seconds
         self.memory_limit_mb = memory_limit_mb
+        self._pool = None
+
+        # Resolved once here rather than in _set_resource_limits, which
+        # runs as a preexec_fn between fork and exec for every fallback
+        # subprocess; platform.system() forks a process of its own on
+        # some platforms. None means no RLIMIT_AS (macOS, where setting
+        # it segfaults the child).
+        self._memory_bytes = (
+            None
+            if platform.system() == "Darwin"
+            else memory_limit_mb * 1024 * 1024
+        )
+
+        # The sanitized child environment never changes between runs,
+        # so build it once instead of copying os.environ per execution.
+        self._safe_env = self._build_safe_env()
+
+    def _get_pool(self) -> SandboxPool:
+        if self._pool is None:
+            self._pool = _get_shared_pool(
+                self.timeout_seconds, self.memory_limit_mb
+            )
+        return self._pool
 
     def execute_solution(
         self, task: HumanEvalTask, solution_code: str
@@ -82,21 +315,54 @@ class SecureSandbox:
         """
         Execute solution in secure sandbox with timeouts and resource limits
         """
-        start_time = time.time()
+        # Monotonic clock: immune to NTP adjustments and cheaper than the
+        # wall clock; we only need durations here.
+        start_time = time.monotonic()
+
+        try:
+            passed, total, error = self._get_pool().run(
+                task.task_id, f"{task.prompt}\n{solution_code}", task.test
+            )
+        except (OSError, ValueError):
+            # Pool unavailable (e.g. fork not permitted); fall back to a
+            # one-shot subprocess.
+            return self._execute_in_subprocess(task, solution_code, start_time)
+
+        execution_time = time.monotonic() - start_time
+
+        if error is None:
+            ratio = passed / total if total > 0 else 0.0
+            print(f"DEBUG: passed={passed}, total={total}, ratio={ratio}")
+            return ExecutionResult(
+                passed=passed,
+                total=total,
+                ratio=ratio,
+                execution_time=execution_time,
+            )
 
+        print(f"DEBUG: Execution failed with error: {error}")
+        return ExecutionResult(
+            passed=0,
+            total=1,
+            ratio=0.0,
+            error=error,
+            execution_time=execution_time,
+        )
+
+    def _execute_in_subprocess(
+        self, task: HumanEvalTask, solution_code: str, start_time: float
+    ) -> ExecutionResult:
+        """One-shot subprocess execution (fallback path)."""
         try:
-            # Create temporary file for the solution
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".py", delete=False
-            ) as f:
-                # Write the complete solution
-                full_code = f"{task.prompt}\n{solution_code}\n{task.test}"
-                f.write(full_code)
-                temp_file = f.name
+            # Pipe the code straight to the interpreter's stdin instead
+            # of round-tripping it through a temp file: no disk write,
+            # no unlink, and nothing left behind if we are killed.
+            full_code = f"{task.prompt}\n{solution_code}\n{task.test}"
 
             # Execute with resource limits
             result = subprocess.run(
-                [sys.executable, temp_file],
+                [sys.executable, "-"],
+                input=full_code,
                 capture_output=True,
                 text=True,
                 timeout=self.timeout_seconds,
@@ -104,7 +370,7 @@ class SecureSandbox:
                 env=self._get_safe_env(),
             )
 
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
 
             # Parse test results
             if result.returncode == 0:
@@ -160,14 +426,8 @@ class SecureSandbox:
                 total=1,
                 ratio=0.0,
                 error=str(e),
-                execution_time=time.time() - start_time,
+                execution_time=time.monotonic() - start_time,
             )
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(temp_file)
-            except OSError:
-                pass
 
     def _set_resource_limits(self):
         """Set resource limits for the sandbox"""
@@ -177,17 +437,16 @@ class SecureSandbox:
         )
 
         # Memory limit - skip RLIMIT_AS on macOS (Darwin) to avoid segfault
-        if platform.system() != "Darwin":
-            memory_bytes = self.memory_limit_mb * 1024 * 1024
+        if self._memory_bytes is not None:
             resource.setrlimit(
-                resource.RLIMIT_AS, (memory_bytes, memory_bytes)
+                resource.RLIMIT_AS, (self._memory_bytes, self._memory_bytes)
             )
 
         # Disable core dumps
         resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
 
-    def _get_safe_env(self) -> Dict[str, str]:
-        """Get safe environment variables for sandbox"""
+    def _build_safe_env(self) -> Dict[str, str]:
+        """Build safe environment variables for sandbox"""
         env = os.environ.copy()
 
         # Set deterministic hash seed
@@ -200,6 +459,49 @@ class SecureSandbox:
 
         return env
 
+    def _get_safe_env(self) -> Dict[str, str]:
+        """Get safe environment variables for sandbox"""
+        return self._safe_env
+
+
+class _AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for asyncio.
+
+    Allows bursts up to the bucket capacity while keeping the average
+    rate at max_rate per time_period seconds. Unlike a semaphore, the
+    bucket refills continuously, so it never runs dry permanently and
+    concurrent requests are not serialized behind a fixed per-request
+    sleep.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self._rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.max_rate,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
 
 class AsyncHumanEvalRunner:
     """Async runner for HumanEval tasks with rate limiting and progressive
@@ -211,19 +513,50 @@ class AsyncHumanEvalRunner:
         requests_per_minute: int = 50,
         progressive_sampling: bool = True,
         use_mock: bool = False,
+        adaptive: bool = False,
+        n_min: int = 3,
+        tau: float = 0.9,
     ):
         self.max_concurrent = max_concurrent
         self.requests_per_minute = requests_per_minute
         self.progressive_sampling = progressive_sampling
         self.use_mock = use_mock
 
-        # Rate limiting
+        # Adaptive early stopping: once n_min samples are in, stop a
+        # task when the Beta-Binomial confidence in the modal solution,
+        # (1 + n_modal) / (2 + n), reaches tau. Easy tasks converge on
+        # one answer after a handful of draws, so the remaining samples
+        # are unlikely to change the best-of-n pick. Off by default so
+        # exact-n runs stay reproducible.
+        self.adaptive = adaptive
+        self.n_min = n_min
+        self.tau = tau
+
+        # Rate limiting: bounded concurrency plus a token bucket for
+        # the average request rate.
         self.semaphore = asyncio.Semaphore(max_concurrent)
-        self.rate_limiter = asyncio.Semaphore(requests_per_minute)
+        self.rate_limiter = _AsyncRateLimiter(requests_per_minute, 60.0)
+
+        # Bound concurrent sandbox evaluations to the core count so
+        # parallel evals don't oversubscribe the machine.
+        self.eval_semaphore = asyncio.Semaphore(os.cpu_count() or 1)
 
         # Sandbox
         self.sandbox = SecureSandbox()
 
+        # Generation cache keyed (task_id, temperature, sample_idx).
+        # run_experiment sweeps n=1, 4, 16 over the same tasks; sample
+        # indices make the n=1 draw the first of the n=4 draws and so
+        # on, so later sweeps only pay for the additional samples.
+        self._gen_cache: Dict[Tuple[str, float, int], str] = {}
+
+        # Evaluation cache keyed (task_id, solution). Because best-of-k
+        # draws are a prefix of best-of-n draws, the n=16 sweep replays
+        # the n=1 and n=4 candidates; cached sandbox results make those
+        # replays free instead of re-running the test suite. Cached
+        # ExecutionResults are shared and treated as read-only.
+        self._eval_cache: Dict[Tuple[str, str], ExecutionResult] = {}
+
         # Load HumanEval tasks
         self.tasks = self._load_humaneval_tasks()
 
@@ -236,14 +569,28 @@ class AsyncHumanEvalRunner:
             raise ImportError("human-eval not installed")
 
         import gzip
-        import json
+        import pickle
+        from pathlib import Path
+
+        # Parsed tasks are cached on disk so repeat constructions skip
+        # the decompress-and-parse pass entirely; the mtime check
+        # invalidates the cache when the dataset file changes.
+        cache_file = Path("~/.cache/safe/humaneval.pkl").expanduser()
+        source_mtime = os.path.getmtime(HUMAN_EVAL)
+        if cache_file.exists() and cache_file.stat().st_mtime > source_mtime:
+            try:
+                tasks = pickle.loads(cache_file.read_bytes())
+                print(f"Loaded {len(tasks)} HumanEval tasks (cached)")
+                return tasks
+            except Exception:
+                pass  # Stale or corrupt cache; reparse below
 
         tasks = []
 
         # HUMAN_EVAL is a path to a gzipped JSONL file
-        with gzip.open(HUMAN_EVAL, "rt", encoding="utf-8") as f:
+        with gzip.open(HUMAN_EVAL, "rb") as f:
             for line in f:
-                task_data = json.loads(line.strip())
+                task_data = loads_json(line)
                 task = HumanEvalTask(
                     task_id=task_data["task_id"],
                     prompt=task_data["prompt"],
@@ -253,18 +600,37 @@ class AsyncHumanEvalRunner:
                 )
                 tasks.append(task)
 
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(
+                pickle.dumps(tasks, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        except OSError:
+            pass  # Cache directory not writable; parsing still succeeded
+
         print(f"Loaded {len(tasks)} HumanEval tasks")
         return tasks
 
     async def generate_solution(
-        self, task: HumanEvalTask, temperature: float = 0.7
+        self,
+        task: HumanEvalTask,
+        temperature: float = 0.7,
+        sample_idx: Optional[int] = None,
     ) -> str:
-        """Generate solution for a task with rate limiting"""
+        """Generate solution for a task with rate limiting.
+
+        When sample_idx is given, the (task, temperature, sample_idx)
+        draw is cached so repeated sweeps reuse earlier generations.
+        """
+        if sample_idx is not None:
+            cached = self._gen_cache.get(
+                (task.task_id, temperature, sample_idx)
+            )
+            if cached is not None:
+                return cached
+
         async with self.semaphore:
             async with self.rate_limiter:
-                # Add delay to respect rate limits
-                await asyncio.sleep(60.0 / self.requests_per_minute)
-
                 prompt = """Complete the following Python function:
 
 {task.prompt}
@@ -288,6 +654,10 @@ Provide only the function implementation, no explanations:"""
                     solution = response.strip()
                     print(f"DEBUG: Generated solution for {task.task_id}: ")
                     print(f"DEBUG: {solution[: 200]}...")  # First 200 chars
+                    if sample_idx is not None and solution:
+                        self._gen_cache[
+                            (task.task_id, temperature, sample_idx)
+                        ] = solution
                     return solution
                 except Exception as e:
                     print(f"Error generating solution for {task.task_id}: {e}")
@@ -299,38 +669,121 @@ Provide only the function implementation, no explanations:"""
         """Evaluate solution using secure sandbox"""
         return self.sandbox.execute_solution(task, solution)
 
+    async def _generate_and_evaluate(
+        self,
+        task: HumanEvalTask,
+        count: int,
+        temperature: float,
+        solutions: List[str],
+        start_idx: int = 0,
+    ) -> Tuple[Optional[ExecutionResult], Optional[str]]:
+        """
+        Generate count solutions, evaluating each as soon as it arrives.
+
+        Generation and evaluation are pipelined per candidate, and the
+        first perfect result cancels the remaining in-flight
+        generations — saving both model tokens and sandbox CPU on easy
+        tasks. Generated solutions are appended to the caller's list;
+        returns the best (result, solution) pair seen.
+
+        Identical candidates (common at low temperature) are evaluated
+        once: duplicates await the first copy's sandbox result instead
+        of re-running the tests.
+        """
+        seen: Dict[str, asyncio.Future] = {}
+
+        async def _gen_and_eval(sample_idx):
+            solution = await self.generate_solution(
+                task, temperature, sample_idx=sample_idx
+            )
+            if not solution:  # Skip empty solutions
+                return solution, None
+            key = solution.strip()
+            cached = self._eval_cache.get((task.task_id, key))
+            if cached is not None:
+                return solution, cached
+            pending = seen.get(key)
+            if pending is not None:
+                return solution, await pending
+            waiter = asyncio.get_running_loop().create_future()
+            seen[key] = waiter
+            try:
+                async with self.eval_semaphore:
+                    result = await asyncio.to_thread(
+                        self.evaluate_solution, task, solution
+                    )
+            except BaseException:
+                # Let a later duplicate evaluate instead of waiting on
+                # a result that will never arrive.
+                del seen[key]
+                if not waiter.done():
+                    waiter.cancel()
+                raise
+            waiter.set_result(result)
+            self._eval_cache[(task.task_id, key)] = result
+            return solution, result
+
+        gen_tasks = [
+            asyncio.create_task(_gen_and_eval(start_idx + i))
+            for i in range(count)
+        ]
+        best_result = None
+        best_solution = None
+        sample_counts: Dict[str, int] = {}
+        completed = 0
+        modal = 0
+        try:
+            for future in asyncio.as_completed(gen_tasks):
+                solution, result = await future
+                solutions.append(solution)
+                if result is None:
+                    continue
+                if best_result is None or result.ratio > best_result.ratio:
+                    best_result, best_solution = result, solution
+                if best_result.ratio >= 1.0:
+                    break
+                if self.adaptive:
+                    completed += 1
+                    key = solution.strip()
+                    occurrences = sample_counts.get(key, 0) + 1
+                    sample_counts[key] = occurrences
+                    if occurrences > modal:
+                        modal = occurrences
+                    # Beta-Binomial confidence (alpha0 = beta0 = 1) that
+                    # the modal candidate is the converged answer; stop
+                    # drawing once it clears tau.
+                    if (
+                        completed >= self.n_min
+                        and (1 + modal) / (2 + completed) >= self.tau
+                    ):
+                        break
+        finally:
+            for gen_task in gen_tasks:
+                gen_task.cancel()
+            await asyncio.gather(*gen_tasks, return_exceptions=True)
+
+        return best_result, best_solution
+
     async def run_best_of_n(
         self, task: HumanEvalTask, n: int, temperature: float = 0.7
     ) -> Tuple[ExecutionResult, List[str]]:
         """
         Run best-of-n with progressive sampling
         """
-        solutions = []
+        solutions: List[str] = []
 
         # Progressive sampling: start with n=4, add more if needed
         initial_n = min(4, n) if self.progressive_sampling else n
 
-        # Generate initial solutions
+        # Generate and evaluate initial solutions, stopping early on
+        # the first perfect pass.
         print(f"Generating {initial_n} solutions for {task.task_id}...")
-        tasks = [
-            self.generate_solution(task, temperature) for _ in range(initial_n)
-        ]
-        initial_solutions = await asyncio.gather(*tasks)
-        solutions.extend(initial_solutions)
-
-        # Evaluate initial solutions
-        results = []
-        for solution in initial_solutions:
-            if solution:  # Skip empty solutions
-                result = self.evaluate_solution(task, solution)
-                results.append((result, solution))
+        best_result, best_solution = await self._generate_and_evaluate(
+            task, initial_n, temperature, solutions
+        )
 
         # Check if we have a perfect solution
-        perfect_solutions = [r for r in results if r[0].ratio >= 1.0]
-        if perfect_solutions:
-            best_result, best_solution = max(
-                perfect_solutions, key=lambda x: x[0].ratio
-            )
+        if best_result is not None and best_result.ratio >= 1.0:
             return best_result, [best_solution]
 
         # If no perfect solution and we need more samples
@@ -340,22 +793,18 @@ Provide only the function implementation, no explanations:"""
                 f"No perfect solution found, generating {remaining_n} more..."
             )
 
-            additional_tasks = [
-                self.generate_solution(task, temperature)
-                for _ in range(remaining_n)
-            ]
-            additional_solutions = await asyncio.gather(*additional_tasks)
-            solutions.extend(additional_solutions)
-
-            # Evaluate additional solutions
-            for solution in additional_solutions:
-                if solution:
-                    result = self.evaluate_solution(task, solution)
-                    results.append((result, solution))
-
-        # Find best solution
-        if results:
-            best_result, best_solution = max(results, key=lambda x: x[0].ratio)
+            extra_result, extra_solution = await self._generate_and_evaluate(
+                task, remaining_n, temperature, solutions,
+                start_idx=initial_n,
+            )
+            if extra_result is not None and (
+                best_result is None
+                or extra_result.ratio > best_result.ratio
+            ):
+                best_result, best_solution = extra_result, extra_solution
+
+        # Return the best solution found
+        if best_result is not None:
             return best_result, solutions
         else:
             return ExecutionResult(0, 1, 0.0, "No valid solutions"), solutions
@@ -369,20 +818,26 @@ Provide only the function implementation, no explanations:"""
         if not results:
             return ExecutionResult(0, 1, 0.0)
 
-        # Sort by ratio (confidence)
-        sorted_results = sorted(results, key=lambda x: x.ratio, reverse=True)
+        # Sort by ratio (confidence); attrgetter keeps the key lookup
+        # at C level instead of a Python lambda call per comparison.
+        sorted_results = sorted(results, key=_RATIO_KEY, reverse=True)
 
         # Take top 4
         top_4 = sorted_results[:4]
 
-        # Weighted average
-        total_weight = sum(r.ratio for r in top_4)
+        # Weighted average; one pass accumulates all three sums instead
+        # of walking the candidates once per aggregate.
+        total_weight = 0.0
+        weighted_passed = 0.0
+        weighted_total = 0.0
+        for r in top_4:
+            total_weight += r.ratio
+            weighted_passed += r.passed * r.ratio
+            weighted_total += r.total * r.ratio
+
         if total_weight == 0:
             return ExecutionResult(0, 1, 0.0)
 
-        weighted_passed = sum(r.passed * r.ratio for r in top_4)
-        weighted_total = sum(r.total * r.ratio for r in top_4)
-
         final_ratio = (
             weighted_passed / weighted_total if weighted_total > 0 else 0.0
         )
@@ -411,37 +866,45 @@ Provide only the function implementation, no explanations:"""
 
         results = {}
 
-        for n in n_values:
-            print(f"\n=== Running Best-of-{n} ===")
-            n_results = []
+        # Tasks are independent, so each sweep runs them concurrently.
+        # The task-level semaphore keeps the number of in-flight tasks
+        # at max_concurrent; generation rate and sandbox load are still
+        # bounded by the rate limiter and eval semaphore underneath.
+        task_semaphore = asyncio.Semaphore(self.max_concurrent)
 
-            for i, task in enumerate(tasks_to_run):
+        async def _run_task(n: int, i: int, task: HumanEvalTask) -> Dict:
+            async with task_semaphore:
                 print(f"Task {i + 1}/{len(tasks_to_run)}: {task.task_id}")
-
                 result, solutions = await self.run_best_of_n(
                     task, n, temperature
                 )
-                n_results.append(
-                    {
-                        "task_id": task.task_id,
-                        "result": result,
-                        "solutions": solutions,
-                    }
-                )
 
-                # Early exit if we have a perfect solution
-                if result.ratio >= 1.0:
-                    print(
-                        "  ✓ Perfect solution found "
-                        f"(ratio: {result.ratio: .3f})"
-                    )
-                else:
-                    print(
-                        f"  - Partial solution (ratio: {result.ratio: .3f}, "
-                        f"{result.passed}/{result.total})"
-                    )
+            if result.ratio >= 1.0:
+                print(
+                    "  ✓ Perfect solution found "
+                    f"(ratio: {result.ratio: .3f})"
+                )
+            else:
+                print(
+                    f"  - Partial solution (ratio: {result.ratio: .3f}, "
+                    f"{result.passed}/{result.total})"
+                )
+            return {
+                "task_id": task.task_id,
+                "result": result,
+                "solutions": solutions,
+            }
 
-            results[f"bo_{n}"] = n_results
+        for n in n_values:
+            print(f"\n=== Running Best-of-{n} ===")
+            results[f"bo_{n}"] = list(
+                await asyncio.gather(
+                    *[
+                        _run_task(n, i, task)
+                        for i, task in enumerate(tasks_to_run)
+                    ]
+                )
+            )
 
         return results
 
@@ -464,31 +927,38 @@ def save_results(results: Dict[str, Any], output_dir: str = "results"):
 
     # JSON with all details
     json_file = f"{output_dir}/humaneval_results_{timestamp}.json"
-    with open(json_file, "w") as f:
-        json.dump(results, f, indent=2, default=lambda x: x.__dict__)
+    dump_json(results, json_file, default=_dataclass_default)
 
     # CSV summary
     csv_file = f"{output_dir}/humaneval_summary_{timestamp}.csv"
-    with open(csv_file, "w") as f:
-        f.write("n,pass@1,avg_ratio,avg_passed,avg_total,total_tasks\n")
-
-        for n_key, n_results in results.items():
-            n = int(n_key.split("_")[1])
-            pass_at_1 = calculate_pass_at_k(n_results, 1)
-            avg_ratio = sum(r["result"].ratio for r in n_results) / len(
-                n_results
-            )
-            avg_passed = sum(r["result"].passed for r in n_results) / len(
-                n_results
-            )
-            avg_total = sum(r["result"].total for r in n_results) / len(
-                n_results
+    rows = ["n,pass@1,avg_ratio,avg_passed,avg_total,total_tasks\n"]
+
+    for n_key, n_results in results.items():
+        n = int(n_key.split("_")[1])
+        count = len(n_results)
+        # Gather the per-task numbers in one pass over the results, then
+        # reduce each column vectorized; the old version walked the list
+        # once per statistic.
+        stats = np.empty((count, 3), dtype=np.float64)
+        for i, r in enumerate(n_results):
+            result = r["result"]
+            stats[i] = (result.ratio, result.passed, result.total)
+
+        if count:
+            pass_at_1 = float((stats[:, 0] >= 1.0).mean())
+            avg_ratio, avg_passed, avg_total = (
+                float(v) for v in stats.mean(axis=0)
             )
+        else:
+            pass_at_1 = avg_ratio = avg_passed = avg_total = 0.0
 
-            f.write(
-                f"{n},{pass_at_1: .4f},{avg_ratio: .4f},{avg_passed: .2f},"
-                f"{avg_total: .2f},{len(n_results)}\n"
-            )
+        rows.append(
+            f"{n},{pass_at_1: .4f},{avg_ratio: .4f},{avg_passed: .2f},"
+            f"{avg_total: .2f},{len(n_results)}\n"
+        )
+
+    with open(csv_file, "w") as f:
+        f.write("".join(rows))
 
     print(f"Results saved to {json_file} and {csv_file}")
     return json_file, csv_file
@@ -564,8 +1034,7 @@ async def main():
         }
 
         # Save results
-        with open(args.output, "w") as f:
-            json.dump(summary, f, indent=2, default=lambda x: x.__dict__)
+        dump_json(summary, args.output, default=_dataclass_default)
 
         print(f"Results saved to {args.output}")
         print(f"Pass@1: {pass_at_1: .3f}")
@@ -6,16 +6,20 @@ Measures the KL divergence between the original model distribution p(x)
 and the filtered distribution q(x) to validate the self-alignment objective.
 """
 
-import json
 import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from ..core.serialization import dump_json, load_json
 
-@dataclass
+
+@dataclass(slots=True)
 class KLDivergenceResult:
     """Result of KL divergence analysis"""
 
@@ -40,11 +44,40 @@ class KLDivergenceResult:
         }
 
 
+def _bootstrap_kl_chunk(
+    mat_p: np.ndarray,
+    mat_q: np.ndarray,
+    n_iterations: int,
+    seed: int,
+    smoothing_factor: float,
+) -> np.ndarray:
+    """Run a chunk of bootstrap iterations (module-level so it pickles
+    into worker processes)."""
+    analyzer = KLDivergenceAnalyzer(
+        smoothing_factor=smoothing_factor, seed=seed
+    )
+    rng = analyzer.rng
+    n_p = mat_p.shape[0]
+    n_q = mat_q.shape[0]
+    kl_values = np.empty(n_iterations, dtype=np.float64)
+    for i in range(n_iterations):
+        counts_p = mat_p[rng.integers(0, n_p, size=n_p)].sum(axis=0)
+        counts_q = mat_q[rng.integers(0, n_q, size=n_q)].sum(axis=0)
+        kl_values[i] = analyzer._kl_from_counts(counts_p, counts_q)
+    return kl_values
+
+
 class KLDivergenceAnalyzer:
     """Analyzer for KL divergence between model distributions"""
 
-    def __init__(self, smoothing_factor: float = 1e-8):
+    def __init__(
+        self, smoothing_factor: float = 1e-8, seed: Optional[int] = None
+    ):
         self.smoothing_factor = smoothing_factor
+        # One Generator per analyzer: constructing a fresh one per
+        # bootstrap call costs entropy-pool reads, and a fixed seed
+        # makes confidence intervals reproducible.
+        self.rng = np.random.default_rng(seed)
 
     def estimate_token_distribution(
         self, texts: List[str]
@@ -53,40 +86,34 @@ class KLDivergenceAnalyzer:
         if not texts:
             return {}
 
-        # Simple tokenization (words)
-        all_tokens = []
+        # Simple tokenization (words), counted in C by Counter
+        token_counts = Counter()
         for text in texts:
-            tokens = text.lower().split()
-            all_tokens.extend(tokens)
-
-        # Count frequencies
-        token_counts = {}
-        total_tokens = len(all_tokens)
+            token_counts.update(text.lower().split())
 
-        for token in all_tokens:
-            token_counts[token] = token_counts.get(token, 0) + 1
-
-        # Convert to probabilities with smoothing
-        distribution = {}
+        # Convert to probabilities with smoothing in one vectorized
+        # pass instead of a Python loop over the vocabulary.
         vocab_size = len(token_counts)
-        for token, count in token_counts.items():
-            prob = (count + self.smoothing_factor) / (
-                total_tokens + vocab_size * self.smoothing_factor
-            )
-            distribution[token] = prob
+        counts = np.fromiter(
+            token_counts.values(), dtype=np.float64, count=vocab_size
+        )
+        total_tokens = counts.sum()
+        probs = (counts + self.smoothing_factor) / (
+            total_tokens + vocab_size * self.smoothing_factor
+        )
 
-        return distribution
+        return dict(zip(token_counts.keys(), probs))
 
     def calculate_entropy(self, distribution: Dict[str, float]) -> float:
         """Calculate Shannon entropy of a distribution"""
         if not distribution:
             return 0.0
 
-        entropy = 0.0
-        for prob in distribution.values():
-            if prob > 0:
-                entropy -= prob * np.log2(prob)
-        return entropy
+        probs = np.fromiter(
+            distribution.values(), dtype=np.float64, count=len(distribution)
+        )
+        probs = probs[probs > 0]
+        return float(-(probs * np.log2(probs)).sum())
 
     def calculate_kl_divergence(
         self, p_dist: Dict[str, float], q_dist: Dict[str, float]
@@ -95,17 +122,62 @@ class KLDivergenceAnalyzer:
         if not p_dist or not q_dist:
             return 0.0
 
-        kl_div = 0.0
-        all_tokens = set(p_dist.keys()) | set(q_dist.keys())
-
-        for token in all_tokens:
-            p_prob = p_dist.get(token, self.smoothing_factor)
-            q_prob = q_dist.get(token, self.smoothing_factor)
+        # Materialize aligned probability arrays over the shared
+        # vocabulary and reduce in one vectorized op; per-element
+        # scalar np.log2 calls dominate the dict-loop version.
+        vocab = list(set(p_dist.keys()) | set(q_dist.keys()))
+        smoothing = self.smoothing_factor
+        p = np.array(
+            [p_dist.get(t, smoothing) for t in vocab], dtype=np.float64
+        )
+        q = np.array(
+            [q_dist.get(t, smoothing) for t in vocab], dtype=np.float64
+        )
 
-            if p_prob > 0 and q_prob > 0:
-                kl_div += p_prob * np.log2(p_prob / q_prob)
+        mask = (p > 0) & (q > 0)
+        p = p[mask]
+        q = q[mask]
+        return self._kl_reduce(p, q)
+
+    def _smoothed_probs(self, counts: np.ndarray) -> np.ndarray:
+        """Smoothed probabilities from a count vector.
+
+        Tokens absent from the sample (count 0) get the raw smoothing
+        floor, matching what calculate_kl_divergence uses for tokens
+        missing from a distribution dict.
+        """
+        present = counts > 0
+        total = counts.sum()
+        vocab_size = int(present.sum())
+        return np.where(
+            present,
+            (counts + self.smoothing_factor)
+            / (total + vocab_size * self.smoothing_factor),
+            self.smoothing_factor,
+        )
 
-        return kl_div
+    @staticmethod
+    def _kl_reduce(p: np.ndarray, q: np.ndarray) -> float:
+        """Sum of p * log2(p / q) over aligned positive probabilities.
+
+        The ratio buffer is reused for its own log and the final
+        multiply-sum is fused into np.dot, so the reduction allocates
+        one temporary instead of three. Callers guarantee p and q are
+        strictly positive (masking plus the smoothing floor), so the
+        log cannot see zero or negative inputs.
+        """
+        r = p / q
+        np.log2(r, out=r)
+        return float(np.dot(p, r))
+
+    def _kl_from_counts(
+        self, counts_p: np.ndarray, counts_q: np.ndarray
+    ) -> float:
+        """KL(p||q) from two aligned count vectors."""
+        mask = (counts_p > 0) | (counts_q > 0)
+        p = self._smoothed_probs(counts_p)[mask]
+        q = self._smoothed_probs(counts_q)[mask]
+        return self._kl_reduce(p, q)
 
     def bootstrap_confidence_interval(
         self,
@@ -113,23 +185,77 @@ class KLDivergenceAnalyzer:
         texts_q: List[str],
         n_bootstrap: int = 1000,
         confidence: float = 0.95,
+        n_jobs: int = 1,
     ) -> Tuple[float, float]:
-        """Calculate bootstrap confidence interval for KL divergence"""
+        """Calculate bootstrap confidence interval for KL divergence.
+
+        The iterations are independent, so n_jobs=-1 splits them across
+        one process per core; n_jobs=1 keeps the serial path.
+        """
         if len(texts_p) < 2 or len(texts_q) < 2:
             return (0.0, 0.0)
 
-        kl_values = []
-
-        for _ in range(n_bootstrap):
-            # Bootstrap samples
-            boot_p = np.random.choice(texts_p, size=len(texts_p), replace=True)
-            boot_q = np.random.choice(texts_q, size=len(texts_q), replace=True)
+        # Tokenize each corpus once into per-text count rows over a
+        # shared vocabulary. Each bootstrap iteration then resamples
+        # row indices and sums counts — no re-tokenization and no
+        # object-array shuffling of the text lists. Tokens are interned
+        # and mapped to integer vocab indices up front, so counting is
+        # one np.bincount call per text rather than a dict loop over
+        # strings.
+        vocab: Dict[str, int] = {}
+
+        def _index_tokens(text: str) -> np.ndarray:
+            indices = []
+            for token in text.lower().split():
+                token = sys.intern(token)
+                idx = vocab.get(token)
+                if idx is None:
+                    idx = vocab[token] = len(vocab)
+                indices.append(idx)
+            return np.asarray(indices, dtype=np.int32)
+
+        indexed_p = [_index_tokens(text) for text in texts_p]
+        indexed_q = [_index_tokens(text) for text in texts_q]
+        if not vocab:
+            return (0.0, 0.0)
 
-            # Calculate KL divergence for bootstrap sample
-            p_dist = self.estimate_token_distribution(boot_p.tolist())
-            q_dist = self.estimate_token_distribution(boot_q.tolist())
-            kl_val = self.calculate_kl_divergence(p_dist, q_dist)
-            kl_values.append(kl_val)
+        def _count_matrix(indexed: List[np.ndarray]) -> np.ndarray:
+            mat = np.empty((len(indexed), len(vocab)), dtype=np.float64)
+            for row, indices in enumerate(indexed):
+                mat[row] = np.bincount(indices, minlength=len(vocab))
+            return mat
+
+        mat_p = _count_matrix(indexed_p)
+        mat_q = _count_matrix(indexed_q)
+
+        if n_jobs != 1:
+            workers = (os.cpu_count() or 1) if n_jobs < 0 else n_jobs
+            workers = min(workers, n_bootstrap)
+            # Chunk sizes that sum to n_bootstrap, one chunk per worker
+            base, extra = divmod(n_bootstrap, workers)
+            chunk_sizes = [
+                base + (1 if i < extra else 0) for i in range(workers)
+            ]
+            seeds = self.rng.integers(0, 2**32, size=workers)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunks = pool.map(
+                    _bootstrap_kl_chunk,
+                    [mat_p] * workers,
+                    [mat_q] * workers,
+                    chunk_sizes,
+                    [int(s) for s in seeds],
+                    [self.smoothing_factor] * workers,
+                )
+            kl_values = np.concatenate(list(chunks))
+        else:
+            rng = self.rng
+            n_p = len(texts_p)
+            n_q = len(texts_q)
+            kl_values = np.empty(n_bootstrap, dtype=np.float64)
+            for i in range(n_bootstrap):
+                counts_p = mat_p[rng.integers(0, n_p, size=n_p)].sum(axis=0)
+                counts_q = mat_q[rng.integers(0, n_q, size=n_q)].sum(axis=0)
+                kl_values[i] = self._kl_from_counts(counts_p, counts_q)
 
         # Calculate confidence interval
         alpha = 1 - confidence
@@ -177,11 +303,12 @@ class KLDivergenceAnalyzer:
     ) -> KLDivergenceResult:
         """Analyze KL divergence from HumanEval results files"""
 
-        # Load results
-        with open(baseline_file, "r") as f:
-            baseline_data = json.load(f)
-        with open(resonant_filtering_file, "r") as f:
-            resonant_filtering_data = json.load(f)
+        # Load both result files concurrently; the reads and gzip
+        # decompression overlap instead of running back to back.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            baseline_future = pool.submit(load_json, baseline_file)
+            resonant_filtering_data = load_json(resonant_filtering_file)
+            baseline_data = baseline_future.result()
 
         # Extract solution texts
         baseline_texts = []
@@ -202,9 +329,7 @@ class KLDivergenceAnalyzer:
     def save_analysis(self, result: KLDivergenceResult, output_file: str):
         """Save KL divergence analysis to file"""
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
-
-        with open(output_file, "w") as f:
-            json.dump(result.to_dict(), f, indent=2)
+        dump_json(result.to_dict(), output_file)
 
         print(f"KL divergence analysis saved to: {output_file}")
         print(f"KL(p||q) = {result.kl_divergence: .4f}")
@@ -5,14 +5,78 @@ Enhanced Reward Scorer for SAFE
 Provides sophisticated reward scoring for code generation quality assessment.
 """
 
-import json
 import os
-from dataclasses import dataclass
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-
-@dataclass
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from ..core.serialization import dump_json
+
+# Every needle the five scoring dimensions look for. A single lookahead
+# alternation finds all of them in one C-level scan per solution; the
+# old path re-walked the same code string with four to six substring
+# checks per dimension, ~25 passes per scored solution.
+_FEATURE_NEEDLES = (
+    "def ",
+    "return ",
+    "if ",
+    "for ",
+    "while ",
+    "import ",
+    "try:",
+    "except Exception:",
+    "class ",
+    "(",
+    ")",
+    ":",
+)
+_FEATURE_RE = re.compile(
+    "(?=(" + "|".join(re.escape(n) for n in _FEATURE_NEEDLES) + "))"
+)
+
+
+def _scan_features(code: str) -> FrozenSet[str]:
+    """Collect every needle present in code with one regex pass."""
+    return frozenset(_FEATURE_RE.findall(code))
+
+
+@lru_cache(maxsize=32)
+def _feedback_for(
+    low_syntax: bool,
+    low_logic: bool,
+    low_efficiency: bool,
+    low_readability: bool,
+    low_test_coverage: bool,
+) -> str:
+    """Compose feedback for a combination of low-scoring dimensions.
+
+    Feedback depends only on which dimensions fall below the 0.5
+    threshold, so there are at most 32 distinct strings — memoizing
+    them turns the per-solution string assembly into a dict lookup.
+    """
+    feedback_parts = []
+
+    if low_syntax:
+        feedback_parts.append("Syntax needs improvement")
+    if low_logic:
+        feedback_parts.append("Logic could be enhanced")
+    if low_efficiency:
+        feedback_parts.append("Efficiency can be optimized")
+    if low_readability:
+        feedback_parts.append("Readability should be improved")
+    if low_test_coverage:
+        feedback_parts.append("Test coverage is insufficient")
+
+    if not feedback_parts:
+        feedback_parts.append("Good overall code quality")
+
+    return "; ".join(feedback_parts)
+
+
+@dataclass(slots=True)
 class RewardScore:
     """Represents a reward score for a code solution"""
 
@@ -27,16 +91,12 @@ class RewardScore:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return {
-            "overall_score": self.overall_score,
-            "syntax_score": self.syntax_score,
-            "logic_score": self.logic_score,
-            "efficiency_score": self.efficiency_score,
-            "readability_score": self.readability_score,
-            "test_coverage_score": self.test_coverage_score,
-            "detailed_feedback": self.detailed_feedback,
-            "scoring_timestamp": self.scoring_timestamp,
-        }
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+
+# Field names resolved once; to_dict reads them instead of re-listing
+# every key per call.
+RewardScore._FIELDS = tuple(f.name for f in fields(RewardScore))
 
 
 class EnhancedRewardScorer:
@@ -54,134 +114,155 @@ class EnhancedRewardScorer:
 
     def score_syntax(self, code: str) -> float:
         """Score code syntax quality"""
+        return self._syntax_from(code, _scan_features(code))
+
+    def score_logic(self, code: str, task_description: str) -> float:
+        """Score logical correctness based on task requirements"""
+        return self._logic_from(code, task_description, _scan_features(code))
+
+    def score_efficiency(self, code: str) -> float:
+        """Score code efficiency"""
+        return self._efficiency_from(code, _scan_features(code))
+
+    def score_readability(self, code: str) -> float:
+        """Score code readability"""
+        return self._readability_from(code, _scan_features(code))
+
+    def score_test_coverage(self, code: str) -> float:
+        """Score test coverage (simplified)"""
+        return self._test_coverage_from(code, _scan_features(code))
+
+    def _syntax_from(self, code: str, features: FrozenSet[str]) -> float:
         if not code or len(code.strip()) < 10:
             return 0.0
 
         score = 0.0
 
         # Basic syntax indicators
-        if "def " in code:
+        if "def " in features:
             score += 0.3
-        if "return " in code:
+        if "return " in features:
             score += 0.2
-        if ":" in code:
+        if ":" in features:
             score += 0.1
-        if "(" in code and ")" in code:
+        if "(" in features and ")" in features:
             score += 0.1
-        if "if " in code or "for " in code or "while " in code:
+        if (
+            "if " in features
+            or "for " in features
+            or "while " in features
+        ):
             score += 0.2
         if len(code) > 50:
             score += 0.1
 
         return min(1.0, score)
 
-    def score_logic(self, code: str, task_description: str) -> float:
-        """Score logical correctness based on task requirements"""
+    def _logic_from(
+        self, code: str, task_description: str, features: FrozenSet[str]
+    ) -> float:
         if not code or not task_description:
             return 0.0
 
         score = 0.0
 
         # Check for logical constructs
-        if "if " in code:
+        if "if " in features:
             score += 0.2
-        if "for " in code or "while " in code:
+        if "for " in features or "while " in features:
             score += 0.2
-        if "return " in code:
+        if "return " in features:
             score += 0.2
-        if "def " in code:
+        if "def " in features:
             score += 0.2
-        if "import " in code:
+        if "import " in features:
             score += 0.1
-        if "try:" in code or "except Exception:" in code:
+        if "try:" in features or "except Exception:" in features:
             score += 0.1
 
         return min(1.0, score)
 
-    def score_efficiency(self, code: str) -> float:
-        """Score code efficiency"""
+    def _efficiency_from(self, code: str, features: FrozenSet[str]) -> float:
         if not code:
             return 0.0
 
         score = 0.5  # Base score
 
         # Efficiency indicators
-        if "for " in code:
+        if "for " in features:
             score += 0.2
-        if "while " in code:
+        if "while " in features:
             score += 0.1
-        if "if " in code:
+        if "if " in features:
             score += 0.1
-        if "return " in code:
+        if "return " in features:
             score += 0.1
 
         return min(1.0, score)
 
-    def score_readability(self, code: str) -> float:
-        """Score code readability"""
+    def _readability_from(self, code: str, features: FrozenSet[str]) -> float:
         if not code:
             return 0.0
 
         score = 0.5  # Base score
 
         # Readability indicators
-        if "def " in code:
+        if "def " in features:
             score += 0.2
-        if ":" in code:
+        if ":" in features:
             score += 0.1
-        if "(" in code and ")" in code:
+        if "(" in features and ")" in features:
             score += 0.1
         if len(code) > 30:
             score += 0.1
 
         return min(1.0, score)
 
-    def score_test_coverage(self, code: str) -> float:
-        """Score test coverage (simplified)"""
+    def _test_coverage_from(
+        self, code: str, features: FrozenSet[str]
+    ) -> float:
         if not code:
             return 0.0
 
         score = 0.5  # Base score
 
         # Test coverage indicators
-        if "def " in code:
+        if "def " in features:
             score += 0.3
-        if "return " in code:
+        if "return " in features:
             score += 0.2
 
         return min(1.0, score)
 
     def generate_feedback(self, scores: Dict[str, float]) -> str:
         """Generate detailed feedback based on scores"""
-        feedback_parts = []
-
-        if scores["syntax"] < 0.5:
-            feedback_parts.append("Syntax needs improvement")
-        if scores["logic"] < 0.5:
-            feedback_parts.append("Logic could be enhanced")
-        if scores["efficiency"] < 0.5:
-            feedback_parts.append("Efficiency can be optimized")
-        if scores["readability"] < 0.5:
-            feedback_parts.append("Readability should be improved")
-        if scores["test_coverage"] < 0.5:
-            feedback_parts.append("Test coverage is insufficient")
-
-        if not feedback_parts:
-            feedback_parts.append("Good overall code quality")
-
-        return "; ".join(feedback_parts)
+        return _feedback_for(
+            scores["syntax"] < 0.5,
+            scores["logic"] < 0.5,
+            scores["efficiency"] < 0.5,
+            scores["readability"] < 0.5,
+            scores["test_coverage"] < 0.5,
+        )
 
     def score_solution(
-        self, code: str, task_description: str = ""
+        self,
+        code: str,
+        task_description: str = "",
+        timestamp: Optional[str] = None,
     ) -> RewardScore:
-        """Score a complete solution"""
+        """Score a complete solution.
 
-        # Calculate individual scores
-        syntax_score = self.score_syntax(code)
-        logic_score = self.score_logic(code, task_description)
-        efficiency_score = self.score_efficiency(code)
-        readability_score = self.score_readability(code)
-        test_coverage_score = self.score_test_coverage(code)
+        Batch callers pass one shared timestamp so K scores don't cost
+        K datetime constructions and format calls.
+        """
+
+        # Scan the code once; all five dimensions read the same flags
+        features = _scan_features(code)
+        syntax_score = self._syntax_from(code, features)
+        logic_score = self._logic_from(code, task_description, features)
+        efficiency_score = self._efficiency_from(code, features)
+        readability_score = self._readability_from(code, features)
+        test_coverage_score = self._test_coverage_from(code, features)
 
         # Calculate weighted overall score
         scores = {
@@ -207,15 +288,34 @@ class EnhancedRewardScorer:
             readability_score=readability_score,
             test_coverage_score=test_coverage_score,
             detailed_feedback=detailed_feedback,
-            scoring_timestamp=datetime.now().isoformat(),
+            scoring_timestamp=timestamp or datetime.now().isoformat(),
         )
 
     def score_multiple_solutions(
-        self, solutions: List[str], task_description: str = ""
+        self,
+        solutions: List[str],
+        task_description: str = "",
+        max_workers: Optional[int] = None,
     ) -> List[RewardScore]:
-        """Score multiple solutions"""
+        """Score multiple solutions.
+
+        Pass max_workers to fan the batch out over a thread pool;
+        scoring is independent per solution and results keep input
+        order. The default stays serial.
+        """
+        timestamp = datetime.now().isoformat()
+        if max_workers is not None and len(solutions) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return list(
+                    pool.map(
+                        lambda s: self.score_solution(
+                            s, task_description, timestamp
+                        ),
+                        solutions,
+                    )
+                )
         return [
-            self.score_solution(solution, task_description)
+            self.score_solution(solution, task_description, timestamp)
             for solution in solutions
         ]
 
@@ -226,21 +326,23 @@ class EnhancedRewardScorer:
         if not solutions:
             return None, None
 
-        scores = self.score_multiple_solutions(solutions, task_description)
-        best_idx = max(
-            range(len(scores)), key=lambda i: scores[i].overall_score
-        )
+        # Fused score-and-argmax: keep only the running best instead of
+        # materializing the full score list and indexing back into it.
+        best_idx = 0
+        best_score = None
+        for i, solution in enumerate(solutions):
+            score = self.score_solution(solution, task_description)
+            if best_score is None or score.overall_score > best_score.overall_score:
+                best_idx, best_score = i, score
 
-        return solutions[best_idx], scores[best_idx]
+        return solutions[best_idx], best_score
 
     def save_scores(self, scores: List[RewardScore], output_file: str):
         """Save scores to JSON file"""
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
         scores_data = [score.to_dict() for score in scores]
-
-        with open(output_file, "w") as f:
-            json.dump(scores_data, f, indent=2)
+        dump_json(scores_data, output_file)
 
         print(f"Reward scores saved to: {output_file}")
 
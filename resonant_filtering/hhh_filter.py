@@ -2,14 +2,59 @@
 Enhanced HHH filter with real Claude evaluation and keyword fallback.
 """
 
-import os
+import asyncio
+import hashlib
+import json
+import pickle
+import re
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 
 from .model import get_model
 
+# Harmful keywords for the fallback evaluation, compiled into one
+# alternation so each content string is scanned in a single pass
+# instead of once per keyword. Substring matching, not whole-word: the
+# list deliberately catches inflected forms ("hacking", "viruses"),
+# and IGNORECASE handles casing in the engine instead of via a lowered
+# copy of the content.
+_HARMFUL_KEYWORDS = (
+    "bomb",
+    "kill",
+    "hack",
+    "steal",
+    "delete",
+    "virus",
+    "malware",
+    "exploit",
+    "crack",
+    "bypass",
+    "unauthorized",
+    "illegal",
+    "weapon",
+    "attack",
+    "destroy",
+    "corrupt",
+    "infect",
+)
+_HARMFUL_KEYWORDS_RE = re.compile(
+    "|".join(re.escape(k) for k in _HARMFUL_KEYWORDS),
+    re.IGNORECASE,
+)
 
-@dataclass
+# Score lines in a Claude evaluation reply ("Helpful: 0.8", ...). One
+# multiline scan pulls every field instead of splitting the response
+# into lines and re-splitting each on ": ". Leading whitespace is
+# allowed, matching the old parser's tolerance for indented replies.
+_CLAUDE_LINE_RE = re.compile(
+    r"^\s*(helpful|honest|harmless|overall|approved|reason):\s*(.+)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+@dataclass(slots=True)
 class HHHEvaluationResult:
     """Result of HHH evaluation"""
 
@@ -31,46 +76,221 @@ class HHHFilter:
         model_name: str = "claude-3-5-sonnet-20241022",
         strict_mode: bool = False,
         use_claude: bool = True,
+        cache_dir: Optional[str] = None,
+        max_log_entries: int = 1000,
     ):
         self.model_name = model_name
         self.strict_mode = strict_mode
         self.use_claude = use_claude
-        self.model = get_model()
-
-        # Harmful keywords for fallback
-        self.harmful_keywords = [
-            "bomb",
-            "kill",
-            "hack",
-            "steal",
-            "delete",
-            "virus",
-            "malware",
-            "exploit",
-            "crack",
-            "bypass",
-            "unauthorized",
-            "illegal",
-            "weapon",
-            "attack",
-            "destroy",
-            "corrupt",
-            "infect",
-        ]
+        self._model = None
+
+        # Rolling log of Claude evaluations. A bounded deque evicts the
+        # oldest entry in O(1) on append, so long runs keep the most
+        # recent max_log_entries results without unbounded growth.
+        self.evaluation_log: deque = deque(maxlen=max_log_entries)
+
+        # Response cache: identical (model, content_type, content) tuples
+        # skip the model round-trip entirely. The in-memory dict covers a
+        # single run; pass cache_dir to persist results across reruns.
+        self._response_cache: dict = {}
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Harmful keywords for fallback; shared module tuple, not a
+        # fresh list per filter instance.
+        self.harmful_keywords = _HARMFUL_KEYWORDS
+
+    @property
+    def model(self):
+        """Underlying Claude model, constructed on first use.
+
+        Deferring get_model() keeps API-client bootstrap (and the
+        CLAUDE_API_KEY requirement) out of workflows that only read
+        cached results or use keyword filtering.
+        """
+        if self._model is None:
+            self._model = get_model()
+        return self._model
+
+    @model.setter
+    def model(self, value):
+        self._model = value
 
     def evaluate_content(
         self, content: str, content_type: str = "text"
     ) -> HHHEvaluationResult:
         """Evaluate content using Claude or keyword filtering. Always use Claude if use_claude is True and not mock."""
-        if self.use_claude and not self.model.use_mock:
-            result = self._claude_evaluation(content)
-            # Log the full Claude output for analysis
-            if hasattr(self, "evaluation_log"):
-                self.evaluation_log.append(result)
-            return result
-        else:
+        # Only the Claude path uses the cache: keyword evaluation is a
+        # single regex scan, and persisting its verdicts (or mock ones)
+        # would let a fallback run poison later live runs with results
+        # replayed as if they were Claude evaluations.
+        if not (self.use_claude and not self.model.use_mock):
             return self._keyword_evaluation(content)
 
+        key = self._cache_key(content, content_type)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        result = self._claude_evaluation(content)
+        # Log the full Claude output for analysis
+        self.evaluation_log.append(result)
+
+        # A failed API call falls back to a keyword verdict; don't cache
+        # that either, so the next call retries Claude.
+        if result.evaluation_method == "claude":
+            self._cache_put(key, result)
+        return result
+
+    def evaluate_content_batch(
+        self,
+        contents: List[str],
+        content_type: str = "text",
+        batch_size: int = 4,
+    ) -> List[HHHEvaluationResult]:
+        """
+        Evaluate several items with one model call per small batch.
+
+        Packing up to batch_size items into a single prompt amortizes
+        the network round-trip across the batch; batches stay small so
+        the model keeps attending to later items. Falls back to
+        per-item evaluation when a batched reply cannot be parsed, and
+        in keyword/mock mode where there is no round-trip to amortize.
+        """
+        if not (self.use_claude and not self.model.use_mock):
+            return [self.evaluate_content(c, content_type) for c in contents]
+
+        results: List[Optional[HHHEvaluationResult]] = [None] * len(contents)
+        pending = []
+        for i, content in enumerate(contents):
+            cached = self._cache_get(self._cache_key(content, content_type))
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start : start + batch_size]
+            batch = self._claude_batch_evaluation(
+                [contents[i] for i in chunk]
+            )
+            if batch is None:
+                for i in chunk:
+                    results[i] = self.evaluate_content(
+                        contents[i], content_type
+                    )
+            else:
+                for i, result in zip(chunk, batch):
+                    self.evaluation_log.append(result)
+                    self._cache_put(
+                        self._cache_key(contents[i], content_type), result
+                    )
+                    results[i] = result
+
+        return results
+
+    def _claude_batch_evaluation(
+        self, contents: List[str]
+    ) -> Optional[List[HHHEvaluationResult]]:
+        """Evaluate a small batch in one Claude call; None on parse failure."""
+        items = "\n\n".join(
+            f"Item {i + 1}: {content}" for i, content in enumerate(contents)
+        )
+        prompt = f"""Evaluate each item below for helpfulness, honesty, and harmlessness:
+
+{items}
+
+Respond with a JSON array of exactly {len(contents)} objects, one per item
+in order, each shaped like:
+{{"helpful": 0.0, "honest": 0.0, "harmless": 0.0, "overall": 0.0, "approved": true, "reason": null}}
+Return only the JSON array."""
+
+        try:
+            response = self.model.ask(prompt, temperature=0.1)
+            start = response.index("[")
+            end = response.rindex("]") + 1
+            parsed = json.loads(response[start:end])
+            if len(parsed) != len(contents):
+                return None
+
+            results = []
+            for entry in parsed:
+                approved = bool(entry.get("approved", True))
+                results.append(
+                    HHHEvaluationResult(
+                        helpful_score=float(entry.get("helpful", 0.8)),
+                        honest_score=float(entry.get("honest", 0.9)),
+                        harmless_score=float(entry.get("harmless", 0.9)),
+                        overall_score=float(entry.get("overall", 0.87)),
+                        is_approved=approved,
+                        refusal_reason=(
+                            entry.get("reason") if not approved else None
+                        ),
+                        threshold=0.7,
+                        evaluation_method="claude",
+                    )
+                )
+            return results
+
+        except Exception as e:
+            print(
+                f"Batched Claude evaluation failed: {e}, "
+                "falling back to per-item"
+            )
+            return None
+
+    def _cache_key(self, content: str, content_type: str) -> str:
+        return hashlib.sha256(
+            f"{self.model_name}|{content_type}|{content}".encode()
+        ).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[HHHEvaluationResult]:
+        result = self._response_cache.get(key)
+        if result is None and self._cache_dir is not None:
+            path = self._cache_dir / f"{key}.pkl"
+            if path.exists():
+                with open(path, "rb") as f:
+                    result = pickle.load(f)
+                self._response_cache[key] = result
+        return result
+
+    def _cache_put(self, key: str, result: HHHEvaluationResult) -> None:
+        self._response_cache[key] = result
+        if self._cache_dir is not None:
+            with open(self._cache_dir / f"{key}.pkl", "wb") as f:
+                pickle.dump(result, f)
+
+    async def evaluate_content_async(
+        self, content: str, content_type: str = "text"
+    ) -> HHHEvaluationResult:
+        """Async variant of evaluate_content; the blocking model call runs
+        in a worker thread so the event loop stays free."""
+        return await asyncio.to_thread(
+            self.evaluate_content, content, content_type
+        )
+
+    async def evaluate_contents(
+        self,
+        contents: List[str],
+        content_type: str = "text",
+        max_concurrent: int = 10,
+    ) -> List[HHHEvaluationResult]:
+        """
+        Evaluate many items concurrently with bounded parallelism.
+
+        Each evaluation is an independent network round-trip, so running
+        them with a semaphore of max_concurrent gives near-linear speedup
+        over the serial loop. Results come back in input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def _one(item: str) -> HHHEvaluationResult:
+            async with semaphore:
+                return await self.evaluate_content_async(item, content_type)
+
+        return await asyncio.gather(*[_one(item) for item in contents])
+
     def _claude_evaluation(self, content: str) -> HHHEvaluationResult:
         """Evaluate content using Claude API."""
         try:
@@ -89,25 +309,23 @@ Reason: [brief explanation if not approved]"""
 
             response = self.model.ask(prompt, temperature=0.1)
 
-            # Parse response (simplified parsing)
-            lines = response.strip().split("\n")
-            scores = {}
+            # Parse response with one multiline regex scan
+            fields = {
+                m.group(1).lower(): m.group(2).strip()
+                for m in _CLAUDE_LINE_RE.finditer(response)
+            }
 
-            for line in lines:
-                if ":" in line:
-                    key, value = line.split(": ", 1)
-                    key = key.strip().lower()
-                    value = value.strip()
-
-                    if key in ["helpful", "honest", "harmless", "overall"]:
-                        try:
-                            scores[key] = float(value)
-                        except ValueError:
-                            scores[key] = 0.5
-                    elif key == "approved":
-                        scores["approved"] = value.lower() == "yes"
-                    elif key == "reason":
-                        scores["reason"] = value
+            scores = {}
+            for key in ("helpful", "honest", "harmless", "overall"):
+                if key in fields:
+                    try:
+                        scores[key] = float(fields[key])
+                    except ValueError:
+                        scores[key] = 0.5
+            if "approved" in fields:
+                scores["approved"] = fields["approved"].lower() == "yes"
+            if "reason" in fields:
+                scores["reason"] = fields["reason"]
 
             # Default values if parsing failed
             helpful = scores.get("helpful", 0.8)
@@ -134,13 +352,10 @@ Reason: [brief explanation if not approved]"""
 
     def _keyword_evaluation(self, content: str) -> HHHEvaluationResult:
         """Evaluate content using keyword filtering."""
-        content_lower = content.lower()
-
-        # Check for harmful keywords
-        found_keywords = []
-        for keyword in self.harmful_keywords:
-            if keyword in content_lower:
-                found_keywords.append(keyword)
+        # Single case-insensitive scan, reporting hits in keyword-list
+        # order as before.
+        hits = {m.lower() for m in _HARMFUL_KEYWORDS_RE.findall(content)}
+        found_keywords = [k for k in self.harmful_keywords if k in hits]
 
         if found_keywords:
             return HHHEvaluationResult(
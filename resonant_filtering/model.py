@@ -4,7 +4,9 @@ Claude API wrapper with real and mock modes.
 
 import os
 import re
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional
 
 # Load environment variables from .env file
 try:
@@ -22,6 +24,17 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
 
 
+@lru_cache(maxsize=4)
+def _get_client(api_key: str):
+    """Shared anthropic client per api_key.
+
+    The client owns an httpx connection pool, so constructing one per
+    ClaudeModel instance would reopen TLS and lose keep-alive between
+    calls; caching lets every instance with the same key reuse one
+    pooled connection."""
+    return anthropic.Anthropic(api_key=api_key)
+
+
 class ClaudeModel:
     """Claude API wrapper with real and mock modes."""
 
@@ -48,7 +61,7 @@ class ClaudeModel:
         if ANTHROPIC_AVAILABLE and not self.use_mock:
             if not self.api_key:
                 raise ValueError("API key is required for real mode")
-            self.client = anthropic.Anthropic(api_key=self.api_key)
+            self.client = _get_client(self.api_key)
         else:
             self.client = None
 
@@ -72,6 +85,50 @@ class ClaudeModel:
             print(f"API call failed: {e}")
             raise RuntimeError(f"Claude API call failed: {e}")
 
+    def ask_many(
+        self,
+        prompts: List[str],
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        max_workers: Optional[int] = None,
+    ) -> List[str]:
+        """Generate responses for several prompts concurrently.
+
+        Each prompt is an independent blocking network round-trip, so
+        fanning out on a thread pool cuts wall time from N*latency to
+        roughly N*latency/workers. Responses come back in prompt order;
+        a failed prompt yields an empty string (with the error printed)
+        so one bad call does not lose the rest of the batch. Mock mode
+        stays serial — there is no round-trip to overlap.
+        """
+        if not prompts:
+            return []
+
+        if self.use_mock or not self.client or len(prompts) == 1:
+            return [
+                self._ask_or_empty(p, temperature, max_tokens)
+                for p in prompts
+            ]
+
+        workers = max_workers or min(len(prompts), 16)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    lambda p: self._ask_or_empty(p, temperature, max_tokens),
+                    prompts,
+                )
+            )
+
+    def _ask_or_empty(
+        self, prompt: str, temperature: float, max_tokens: int
+    ) -> str:
+        """ask() that contains failures instead of raising."""
+        try:
+            return self.ask(prompt, temperature, max_tokens)
+        except Exception as e:
+            print(f"Batch prompt failed: {e}")
+            return ""
+
     def _mock_response(self, prompt: str) -> str:
         """Generate mock response for demo purposes."""
         if "HumanEval" in prompt or "def " in prompt: